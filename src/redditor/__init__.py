@@ -3,18 +3,40 @@
 A collection of AI agent pipelines for automating Reddit tasks.
 """
 
+import importlib
+from typing import Any
+
 __version__ = "0.1.0"
 __author__ = "AgenticCompany"
 
-from redditor.config import Settings
-from redditor.reddit.client import RedditClient
-from redditor.pipelines.base import Pipeline
-from redditor.pipelines.registry import PipelineRegistry
+# Public names and the modules that define them. They are imported on
+# first attribute access (PEP 562) so that ``import redditor`` stays cheap.
+_LAZY_EXPORTS = {
+    "Settings": "redditor.config",
+    "RedditClient": "redditor.reddit.client",
+    "AsyncRedditClient": "redditor.reddit.async_client",
+    "Pipeline": "redditor.pipelines.base",
+    "PipelineRegistry": "redditor.pipelines.registry",
+}
 
 __all__ = [
     "__version__",
     "Settings",
     "RedditClient",
+    "AsyncRedditClient",
     "Pipeline",
     "PipelineRegistry",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -4,10 +4,43 @@ Provides commands for managing and running Reddit agent pipelines.
 """
 
 import click
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from redditor import __version__
-from redditor.config import get_settings
+
+if TYPE_CHECKING:
+    from redditor.config import Settings
+
+
+def _get_settings() -> "Settings":
+    """Load application settings on first use.
+    
+    Deferred so that --help, --version and commands that never touch
+    configuration skip the settings import and schema build.
+    """
+    from redditor.config import get_settings
+    
+    return get_settings()
+
+
+# Output of 'config show', rendered with a single str.format call
+_CONFIG_TEMPLATE = """\
+Redditor Configuration
+{separator}
+Debug Mode: {debug}
+Log Level: {log_level}
+
+Reddit API:
+  Client ID: {client_id}
+  User Agent: {user_agent}
+  Username: {username}
+
+AI Configuration:
+  OpenAI: {openai}
+  Anthropic: {anthropic}
+
+Database:
+  URL: {database_url}"""
 
 
 @click.group()
@@ -22,7 +55,9 @@ def main(ctx: click.Context, debug: bool) -> None:
     """
     ctx.ensure_object(dict)
     ctx.obj["debug"] = debug
-    ctx.obj["settings"] = get_settings()
+    # Settings are loaded lazily by the subcommands that need them.
+    ctx.obj["settings"] = None
+    ctx.obj["get_settings"] = _get_settings
 
 
 @main.group()
@@ -41,8 +76,7 @@ def pipeline_list(ctx: click.Context) -> None:
     """List all available pipelines."""
     from redditor.pipelines.registry import PipelineRegistry
     
-    registry = PipelineRegistry()
-    pipelines = registry.all()
+    pipelines = PipelineRegistry.all()
     
     if not pipelines:
         click.echo("No pipelines registered yet.")
@@ -70,8 +104,7 @@ def pipeline_run(
     """
     from redditor.pipelines.registry import PipelineRegistry
     
-    registry = PipelineRegistry()
-    pipeline_cls = registry.get(name)
+    pipeline_cls = PipelineRegistry.get(name)
     
     if pipeline_cls is None:
         click.echo(f"Pipeline '{name}' not found.", err=True)
@@ -86,9 +119,7 @@ def pipeline_run(
     
     try:
         pipeline = pipeline_cls(config=config)
-        pipeline.setup()
-        result = pipeline.execute()
-        pipeline.cleanup()
+        result = pipeline.run()
         
         click.echo(f"Pipeline completed: {result}")
     except Exception as e:
@@ -110,34 +141,30 @@ def config(ctx: click.Context) -> None:
 @click.pass_context
 def config_show(ctx: click.Context, secrets: bool) -> None:
     """Display current configuration."""
-    settings = ctx.obj["settings"]
-    
-    click.echo("Redditor Configuration")
-    click.echo("=" * 40)
-    click.echo(f"Debug Mode: {settings.debug}")
-    click.echo(f"Log Level: {settings.log_level}")
-    click.echo()
-    
-    click.echo("Reddit API:")
-    click.echo(f"  Client ID: {'*' * 8 if settings.reddit.client_id else '(not set)'}")
-    click.echo(f"  User Agent: {settings.reddit.user_agent}")
-    click.echo(f"  Username: {settings.reddit.username or '(not set)'}")
-    click.echo()
-    
-    click.echo("AI Configuration:")
-    click.echo(f"  OpenAI: {'configured' if settings.ai.openai_api_key else 'not configured'}")
-    click.echo(f"  Anthropic: {'configured' if settings.ai.anthropic_api_key else 'not configured'}")
-    click.echo()
-    
-    click.echo("Database:")
-    click.echo(f"  URL: {settings.database.url}")
+    settings = ctx.obj["get_settings"]()
+    
+    reddit = settings.reddit
+    ai = settings.ai
+    click.echo(
+        _CONFIG_TEMPLATE.format(
+            separator="=" * 40,
+            debug=settings.debug,
+            log_level=settings.log_level,
+            client_id="*" * 8 if reddit.client_id else "(not set)",
+            user_agent=reddit.user_agent,
+            username=reddit.username or "(not set)",
+            openai="configured" if ai.openai_api_key else "not configured",
+            anthropic="configured" if ai.anthropic_api_key else "not configured",
+            database_url=settings.database.url,
+        )
+    )
 
 
 @config.command("check")
 @click.pass_context
 def config_check(ctx: click.Context) -> None:
     """Verify configuration is valid."""
-    settings = ctx.obj["settings"]
+    settings = ctx.obj["get_settings"]()
     
     issues = []
     
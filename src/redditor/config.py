@@ -1,17 +1,19 @@
 """Configuration management for Redditor.
 
 Uses Pydantic Settings for environment variable management
-with validation and type hints.
+with validation and type hints. A single ``Settings`` class reads the
+environment; sub-groups are plain models populated through nested
+variables such as ``REDDITOR_REDDIT__CLIENT_ID``.
 """
 
-from functools import lru_cache
+import os
 from typing import Optional
 
-from pydantic import Field
+from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
-class RedditSettings(BaseSettings):
+class RedditSettings(BaseModel):
     """Reddit API configuration."""
     
     client_id: str = Field(default="", description="Reddit OAuth2 client ID")
@@ -19,25 +21,16 @@ class RedditSettings(BaseSettings):
     user_agent: str = Field(default="redditor/0.1.0", description="Reddit API user agent")
     username: Optional[str] = Field(default=None, description="Reddit username (optional)")
     password: Optional[str] = Field(default=None, description="Reddit password (optional)")
-    
-    model_config = SettingsConfigDict(
-        env_prefix="REDDIT_",
-        env_file=".env",
-    )
 
 
-class AISettings(BaseSettings):
+class AISettings(BaseModel):
     """AI API configuration."""
     
     openai_api_key: Optional[str] = Field(default=None, description="OpenAI API key")
     anthropic_api_key: Optional[str] = Field(default=None, description="Anthropic API key")
-    
-    model_config = SettingsConfigDict(
-        env_file=".env",
-    )
 
 
-class DatabaseSettings(BaseSettings):
+class DatabaseSettings(BaseModel):
     """Database configuration."""
     
     url: str = Field(
@@ -45,11 +38,6 @@ class DatabaseSettings(BaseSettings):
         description="Database connection URL",
     )
     echo: bool = Field(default=False, description="Echo SQL queries")
-    
-    model_config = SettingsConfigDict(
-        env_prefix="DATABASE_",
-        env_file=".env",
-    )
 
 
 class Settings(BaseSettings):
@@ -66,6 +54,7 @@ class Settings(BaseSettings):
     model_config = SettingsConfigDict(
         env_prefix="REDDITOR_",
         env_file=".env",
+        env_nested_delimiter="__",
     )
     
     def is_reddit_configured(self) -> bool:
@@ -77,7 +66,22 @@ class Settings(BaseSettings):
         return bool(self.ai.openai_api_key or self.ai.anthropic_api_key)
 
 
-@lru_cache()
+_SETTINGS: Optional[Settings] = None
+
+
 def get_settings() -> Settings:
-    """Get cached application settings."""
-    return Settings()
+    """Get the shared application settings.
+    
+    This is the only supported way to obtain settings; the instance is
+    built once per process and reused by every caller.
+    """
+    global _SETTINGS
+    if _SETTINGS is None:
+        _SETTINGS = Settings()
+    return _SETTINGS
+
+
+# Build settings at import time so commands pay the schema cost up front.
+# Set REDDITOR_SKIP_EAGER_SETTINGS to defer this (e.g. in test runs).
+if not os.environ.get("REDDITOR_SKIP_EAGER_SETTINGS"):
+    _SETTINGS = Settings()
@@ -1,4 +1,11 @@
-"""FastAPI application entry point for Redditor."""
+"""FastAPI application entry point for Redditor.
+
+Route convention: endpoints that return plain dictionaries declare
+``response_model=None`` so FastAPI does not build (and clone) a Pydantic
+response model for them at startup; the return annotation is for type
+checkers only. Routes that need validated output should declare an
+explicit ``response_model``.
+"""
 
 from fastapi import FastAPI
 
@@ -12,8 +19,8 @@ app = FastAPI(
 )
 
 
-@app.get("/")
-async def root():
+@app.get("/", response_model=None)
+async def root() -> dict[str, str]:
     """Root endpoint returning API information."""
     return {
         "name": "Redditor API",
@@ -22,14 +29,19 @@ async def root():
     }
 
 
-@app.get("/health")
-async def health():
+@app.get("/health", response_model=None)
+async def health() -> dict[str, str]:
     """Health check endpoint."""
     return {"status": "healthy"}
 
 
-def run_server(host: str = "0.0.0.0", port: int = 8000):
-    """Run the FastAPI server."""
+def run_server(host: str = "0.0.0.0", port: int = 8000) -> None:
+    """Run the FastAPI server.
+    
+    Runs without auto-reload (uvicorn's default), which re-imports the
+    whole module tree on every file change and is meant for local
+    development only.
+    """
     import uvicorn
     uvicorn.run(app, host=host, port=port)
 
@@ -5,7 +5,7 @@ lifecycle (setup, execute, cleanup) and configuration management.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, ClassVar, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -18,24 +18,46 @@ class Pipeline(ABC):
     lifecycle methods and configuration handling.
     
     Attributes:
+        name: Unique pipeline name, set as a class attribute by subclasses
         config: Pipeline configuration dictionary
         logger: Logger instance for this pipeline
     
     Example:
         ```python
         class MyPipeline(Pipeline):
-            @property
-            def name(self):
-                return "my_pipeline"
+            name = "my_pipeline"
             
             def execute(self):
                 # Do work
                 return {"status": "success"}
         ```
+    
+    Instance state lives in ``__slots__``. Subclasses that want to keep
+    instances free of a ``__dict__`` must declare their own ``__slots__``
+    (``()`` when they add no attributes).
     """
     
-    # Optional: subclasses can define required config keys
-    required_config: list[str] = []
+    __slots__ = ("_config", "_logger")
+    
+    # Unique name of the pipeline; must be set by concrete subclasses
+    name: ClassVar[str] = ""
+    
+    # Optional: subclasses can define required config keys (any iterable;
+    # normalized to a frozenset once per class)
+    required_config: frozenset[str] = frozenset()
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Normalize required config and validate the pipeline name."""
+        super().__init_subclass__(**kwargs)
+        cls.required_config = frozenset(cls.required_config)
+        # Intermediate bases that leave any method abstract may omit the name.
+        # ABCMeta sets __abstractmethods__ only after this hook, so probe members.
+        if any(
+            getattr(getattr(cls, attr, None), "__isabstractmethod__", False) for attr in dir(cls)
+        ):
+            return
+        if not cls.name or not isinstance(cls.name, str):
+            raise TypeError(f"{cls.__name__} must define a non-empty 'name' class attribute")
     
     def __init__(self, config: Optional[dict[str, Any]] = None):
         """Initialize the pipeline with configuration.
@@ -51,21 +73,9 @@ class Pipeline(ABC):
     
     def _validate_config(self) -> None:
         """Validate that required configuration keys are present."""
-        missing = [key for key in self.required_config if key not in self._config]
+        missing = self.required_config - self._config.keys()
         if missing:
-            raise ValueError(f"Missing required config keys: {missing}")
-    
-    @property
-    @abstractmethod
-    def name(self) -> str:
-        """Return the unique name of this pipeline.
-        
-        Must be implemented by subclasses.
-        
-        Returns:
-            Pipeline name string
-        """
-        pass
+            raise ValueError(f"Missing required config keys: {sorted(missing)}")
     
     @property
     def config(self) -> dict[str, Any]:
@@ -87,10 +97,6 @@ class Pipeline(ABC):
         """
         self._logger.debug(f"Setting up pipeline: {self.name}")
     
-    def _setup(self) -> None:
-        """Internal setup alias."""
-        self.setup()
-    
     @abstractmethod
     def execute(self) -> dict[str, Any]:
         """Execute the pipeline's main logic.
@@ -112,10 +118,6 @@ class Pipeline(ABC):
         """
         self._logger.debug(f"Cleaning up pipeline: {self.name}")
     
-    def _cleanup(self) -> None:
-        """Internal cleanup alias."""
-        self.cleanup()
-    
     def run(self) -> dict[str, Any]:
         """Run the complete pipeline lifecycle.
         
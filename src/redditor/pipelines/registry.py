@@ -4,7 +4,10 @@ Provides a central registry for all available pipelines with
 registration, lookup, and listing capabilities.
 """
 
-from typing import Optional, Type
+import importlib
+from importlib import resources
+from types import MappingProxyType
+from typing import Mapping, Optional, Type
 
 from redditor.pipelines.base import Pipeline
 
@@ -12,69 +15,51 @@ from redditor.pipelines.base import Pipeline
 class PipelineRegistry:
     """Central registry for pipeline classes.
     
-    Allows registration and lookup of pipelines by name.
+    Allows registration and lookup of pipelines by name. The registry
+    holds no per-instance state: all methods are classmethods operating
+    on the shared class-level mapping, so call them on the class directly.
+    Use ``PipelineRegistry.has(name)`` for membership checks; the ``in``
+    operator only works on an instance (``name in PipelineRegistry()``).
     
     Example:
         ```python
-        registry = PipelineRegistry()
-        registry.register(MyPipeline)
+        PipelineRegistry.register(MyPipeline)
         
-        pipeline_cls = registry.get("my_pipeline")
+        if PipelineRegistry.has("my_pipeline"):
+            ...
+        pipeline_cls = PipelineRegistry.get("my_pipeline")
         pipeline = pipeline_cls(config={})
         ```
     """
     
+    __slots__ = ()
+    
     # Class-level registry shared across instances
     _pipelines: dict[str, Type[Pipeline]] = {}
     
-    def __init__(self):
-        """Initialize the registry."""
-        # Use instance-level dict if we want isolated registries
-        # For now, share class-level registry
-        pass
-    
-    def register(self, pipeline_cls: Type[Pipeline]) -> None:
+    @classmethod
+    def register(cls, pipeline_cls: Type[Pipeline]) -> None:
         """Register a pipeline class.
         
         Args:
             pipeline_cls: Pipeline class to register
             
         Raises:
-            TypeError: If pipeline_cls is not a Pipeline subclass
+            TypeError: If pipeline_cls is not a Pipeline subclass or has
+                no name (e.g. an abstract intermediate base)
             ValueError: If a pipeline with the same name exists
         """
         if not isinstance(pipeline_cls, type) or not issubclass(pipeline_cls, Pipeline):
             raise TypeError(f"Expected Pipeline subclass, got {type(pipeline_cls)}")
+        if not pipeline_cls.name:
+            raise TypeError(
+                f"{pipeline_cls.__name__} must define a non-empty 'name' class attribute"
+            )
         
-        # Create temporary instance to get name
-        # This works because we're not calling execute()
-        try:
-            # For abstract classes, we need to check differently
-            if hasattr(pipeline_cls, "name") and isinstance(
-                getattr(pipeline_cls, "name", None), property
-            ):
-                # Create a minimal test instance
-                class TempPipeline(pipeline_cls):
-                    @property
-                    def name(self):
-                        return super().name
-                    
-                    def execute(self):
-                        return {}
-                
-                temp = TempPipeline()
-                name = temp.name
-            else:
-                # Try direct instantiation
-                temp = pipeline_cls()
-                name = temp.name
-        except TypeError:
-            # Abstract class - use class name as fallback
-            name = pipeline_cls.__name__.lower().replace("pipeline", "")
-        
-        self._pipelines[name] = pipeline_cls
+        cls._pipelines[pipeline_cls.name] = pipeline_cls
     
-    def get(self, name: str) -> Optional[Type[Pipeline]]:
+    @classmethod
+    def get(cls, name: str) -> Optional[Type[Pipeline]]:
         """Get a pipeline class by name.
         
         Args:
@@ -83,23 +68,58 @@ class PipelineRegistry:
         Returns:
             Pipeline class if found, None otherwise
         """
-        return self._pipelines.get(name)
+        return cls._pipelines.get(name)
     
-    def all(self) -> dict[str, Type[Pipeline]]:
+    @classmethod
+    def all(cls) -> Mapping[str, Type[Pipeline]]:
         """Get all registered pipelines.
         
         Returns:
-            Dictionary mapping names to pipeline classes
+            Read-only live view mapping names to pipeline classes. Use
+            ``dict(PipelineRegistry.all())`` for a mutable snapshot.
         """
-        return dict(self._pipelines)
+        return MappingProxyType(cls._pipelines)
     
-    def __contains__(self, name: str) -> bool:
+    @classmethod
+    def discover(cls, package: str) -> list[str]:
+        """Import every public pipeline module in a package.
+        
+        Modules register their pipelines on import (typically via
+        ``@register_pipeline``). Candidates are filtered on the package
+        listing first, so private (``_``-prefixed) and non-``.py`` entries
+        never reach the import machinery.
+        
+        Args:
+            package: Dotted name of the package to scan
+            
+        Returns:
+            Names of the modules that were imported
+        """
+        imported = []
+        for entry in sorted(resources.files(package).iterdir(), key=lambda e: e.name):
+            filename = entry.name
+            if filename.startswith("_") or not filename.endswith(".py"):
+                continue
+            if not entry.is_file():
+                continue
+            module_name = f"{package}.{filename[:-3]}"
+            importlib.import_module(module_name)
+            imported.append(module_name)
+        return imported
+    
+    @classmethod
+    def has(cls, name: str) -> bool:
         """Check if a pipeline name is registered."""
-        return name in self._pipelines
+        return name in cls._pipelines
+    
+    def __contains__(self, name: str) -> bool:
+        """Support ``name in registry`` on registry instances."""
+        return self.has(name)
     
-    def clear(self) -> None:
+    @classmethod
+    def clear(cls) -> None:
         """Clear all registered pipelines."""
-        self._pipelines.clear()
+        cls._pipelines.clear()
 
 
 # Global registry instance
@@ -116,7 +136,7 @@ def register_pipeline(cls: Type[Pipeline]) -> Type[Pipeline]:
             ...
         ```
     """
-    _global_registry.register(cls)
+    PipelineRegistry.register(cls)
     return cls
 
 
@@ -1,5 +1,15 @@
 """Reddit integration module."""
 
+from typing import Any
+
 from redditor.reddit.client import RedditClient
 
-__all__ = ["RedditClient"]
+__all__ = ["RedditClient", "AsyncRedditClient"]
+
+
+def __getattr__(name: str) -> Any:
+    # Imported on first access so the sync client does not pull in httpx.
+    if name == "AsyncRedditClient":
+        from redditor.reddit.async_client import AsyncRedditClient
+        return AsyncRedditClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
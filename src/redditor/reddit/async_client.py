@@ -0,0 +1,266 @@
+"""Asynchronous Reddit API client for batch pipelines.
+
+Talks to Reddit's OAuth JSON API directly over httpx (HTTP/2) and
+returns plain dictionaries instead of PRAW model objects, so pipelines
+can fan out over many subreddits concurrently with little per-item
+overhead.
+"""
+
+import asyncio
+import time
+from typing import Any, AsyncIterator, Iterable, Optional, cast
+import logging
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+TOKEN_URL = "https://www.reddit.com/api/v1/access_token"
+API_BASE_URL = "https://oauth.reddit.com"
+
+# Reddit caps listing pages at 100 items
+MAX_PAGE_SIZE = 100
+
+POST_SORTS = frozenset({"hot", "new", "top", "rising", "controversial"})
+TIME_FILTERED_SORTS = frozenset({"top", "controversial"})
+
+# Listing statuses meaning the subreddit itself is unavailable (private, banned, missing)
+UNAVAILABLE_SUBREDDIT_STATUSES = frozenset({403, 404})
+
+
+class AsyncRedditClient:
+    """Async Reddit API client using httpx.
+
+    Authenticates with OAuth2 (password grant when a username and
+    password are given, client credentials otherwise) and caches the
+    access token until shortly before it expires.
+
+    Args:
+        client_id: Reddit OAuth2 client ID
+        client_secret: Reddit OAuth2 client secret
+        user_agent: User agent string for API requests
+        username: Optional Reddit username for authenticated actions
+        password: Optional Reddit password for authenticated actions
+        max_concurrency: Maximum number of requests in flight at once
+        transport: Optional httpx transport (mainly for testing)
+
+    Raises:
+        ValueError: If client_id or client_secret are not provided
+
+    Example:
+        ```python
+        async with AsyncRedditClient(client_id, client_secret, user_agent) as client:
+            posts = await client.fetch_posts(["python", "learnpython"], limit=25)
+        ```
+    """
+
+    # Refresh the token this many seconds before Reddit expires it
+    _TOKEN_EXPIRY_MARGIN = 60.0
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        user_agent: str,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        max_concurrency: int = 8,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        if not client_id:
+            raise ValueError("client_id is required")
+        if not client_secret:
+            raise ValueError("client_secret is required")
+
+        self._client_id = client_id
+        self._client_secret = client_secret
+        self._user_agent = user_agent
+        self._username = username
+        self._password = password
+
+        self._http = httpx.AsyncClient(
+            http2=True,
+            headers={"User-Agent": user_agent},
+            transport=transport,
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+        # OAuth token state (monotonic clock)
+        self._token: Optional[str] = None
+        self._token_deadline: float = 0.0
+        self._token_lock = asyncio.Lock()
+
+        # Last rate limit headers reported by Reddit
+        self._rate_limit: dict[str, Optional[float]] = {}
+        # Monotonic deadline of the next rate limit reset (None if unknown)
+        self._reset_deadline: Optional[float] = None
+
+    async def __aenter__(self) -> "AsyncRedditClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._http.aclose()
+
+    @property
+    def rate_limit(self) -> dict[str, Optional[float]]:
+        """Get rate limit information from the most recent response."""
+        return dict(self._rate_limit)
+
+    async def _get_token(self) -> str:
+        """Return a valid access token, fetching a new one if needed."""
+        if self._token is not None and time.monotonic() < self._token_deadline:
+            return self._token
+
+        async with self._token_lock:
+            # Another task may have refreshed while we waited for the lock
+            if self._token is not None and time.monotonic() < self._token_deadline:
+                return self._token
+
+            if self._username and self._password:
+                data = {
+                    "grant_type": "password",
+                    "username": self._username,
+                    "password": self._password,
+                }
+            else:
+                data = {"grant_type": "client_credentials"}
+
+            response = await self._http.post(
+                TOKEN_URL,
+                data=data,
+                auth=(self._client_id, self._client_secret),
+            )
+            response.raise_for_status()
+            payload = cast(dict[str, Any], response.json())
+            if "access_token" not in payload:
+                raise RuntimeError(f"Reddit token request failed: {payload.get('error', payload)}")
+
+            expires_in = float(payload.get("expires_in", 3600))
+            token = str(payload["access_token"])
+            self._token = token
+            self._token_deadline = time.monotonic() + expires_in - self._TOKEN_EXPIRY_MARGIN
+            return token
+
+    def _record_rate_limit(self, headers: httpx.Headers) -> None:
+        """Store Reddit's rate limit headers from a response."""
+        remaining = headers.get("x-ratelimit-remaining")
+        if remaining is None:
+            return
+        used = headers.get("x-ratelimit-used")
+        reset = headers.get("x-ratelimit-reset")
+        reset_in = float(reset) if reset is not None else None
+        self._rate_limit = {
+            "remaining": float(remaining),
+            "used": float(used) if used is not None else None,
+            "reset_timestamp": time.time() + reset_in if reset_in is not None else None,
+        }
+        self._reset_deadline = time.monotonic() + reset_in if reset_in is not None else None
+
+    async def _wait_for_rate_limit(self) -> None:
+        """Sleep until Reddit resets the window once the quota is used up."""
+        remaining = self._rate_limit.get("remaining")
+        if remaining is None or remaining > 0 or self._reset_deadline is None:
+            return
+        delay = self._reset_deadline - time.monotonic()
+        if delay > 0:
+            logger.info("Reddit rate limit reached, waiting %.1fs for reset", delay)
+            await asyncio.sleep(delay)
+
+    async def _get_json(self, path: str, params: dict[str, Any]) -> dict[str, Any]:
+        """Issue an authenticated GET against the OAuth API."""
+        token = await self._get_token()
+        async with self._semaphore:
+            await self._wait_for_rate_limit()
+            response = await self._http.get(
+                f"{API_BASE_URL}{path}",
+                params={**params, "raw_json": 1},
+                headers={"Authorization": f"Bearer {token}"},
+            )
+        self._record_rate_limit(response.headers)
+        response.raise_for_status()
+        return cast(dict[str, Any], response.json())
+
+    async def get_posts(
+        self,
+        subreddit: str,
+        sort: str = "hot",
+        limit: int = 10,
+        time_filter: str = "all",
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Get posts from a subreddit.
+
+        Args:
+            subreddit: Subreddit name
+            sort: Sorting method (hot, new, top, rising, controversial)
+            limit: Maximum number of posts to return
+            time_filter: Time filter for top/controversial (hour, day, week, month, year, all)
+
+        Yields:
+            Post data dictionaries as returned by Reddit's JSON API
+        """
+        if sort not in POST_SORTS:
+            sort = "hot"
+
+        remaining = limit
+        after: Optional[str] = None
+        while remaining > 0:
+            params: dict[str, Any] = {"limit": min(remaining, MAX_PAGE_SIZE)}
+            if sort in TIME_FILTERED_SORTS:
+                params["t"] = time_filter
+            if after:
+                params["after"] = after
+
+            listing = (await self._get_json(f"/r/{subreddit}/{sort}", params))["data"]
+            children = listing["children"]
+            for child in children[:remaining]:
+                yield child["data"]
+            remaining -= len(children)
+
+            after = listing.get("after")
+            if not after or not children:
+                break
+
+    async def fetch_posts(
+        self,
+        subreddits: Iterable[str],
+        sort: str = "hot",
+        limit: int = 10,
+        time_filter: str = "all",
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Fetch posts from several subreddits concurrently.
+
+        Args:
+            subreddits: Subreddit names
+            sort: Sorting method (hot, new, top, rising, controversial)
+            limit: Maximum number of posts per subreddit
+            time_filter: Time filter for top/controversial
+
+        Returns:
+            Dictionary mapping each subreddit name to its list of posts.
+            Unavailable subreddits (403/404: private, banned or missing) are
+            logged and left out instead of failing the whole batch.
+
+        Raises:
+            httpx.HTTPStatusError: If authentication fails or Reddit answers
+                a listing with any other error status (e.g. 401, 429, 5xx)
+        """
+        names = list(subreddits)
+        # Authenticate once up front so bad credentials fail the batch immediately
+        await self._get_token()
+
+        async def collect(name: str) -> Optional[list[dict[str, Any]]]:
+            try:
+                return [post async for post in self.get_posts(name, sort, limit, time_filter)]
+            except httpx.HTTPStatusError as e:
+                status = e.response.status_code
+                if status not in UNAVAILABLE_SUBREDDIT_STATUSES:
+                    raise
+                logger.warning("Skipping r/%s: HTTP %d", name, status)
+                return None
+
+        results = await asyncio.gather(*(collect(name) for name in names))
+        return {name: posts for name, posts in zip(names, results) if posts is not None}
@@ -5,14 +5,29 @@ rate limiting, and common operations.
 """
 
 import time
-from typing import Iterator, Optional, Any
+from itertools import islice
+from types import ModuleType
+from typing import TYPE_CHECKING, Callable, Iterator, Optional, Any, cast
 import logging
 
-import praw
-from praw.models import Submission, Comment, Subreddit
+if TYPE_CHECKING:
+    from praw import Reddit
+    from praw.models import Submission, Comment, Subreddit
 
 logger = logging.getLogger(__name__)
 
+# PRAW is imported on first client construction; see _load_praw().
+praw: "ModuleType | None" = None
+
+
+def _load_praw() -> ModuleType:
+    """Import PRAW on demand and cache it on this module."""
+    global praw
+    if praw is None:
+        import praw as praw_module
+        praw = praw_module
+    return praw
+
 
 class RedditClient:
     """Reddit API client using PRAW.
@@ -31,6 +46,42 @@ class RedditClient:
         ValueError: If client_id or client_secret are not provided
     """
     
+    __slots__ = (
+        "_client_id",
+        "_client_secret",
+        "_user_agent",
+        "_username",
+        "_password",
+        "_reddit",
+        "_next_request_time",
+        "_min_request_interval",
+        "_subreddit_cache",
+        "_auth_cache",
+    )
+    
+    # Listing method per post sort order; unknown sorts fall back to "hot"
+    _SORT_DISPATCH: dict[str, Callable[["Subreddit", int, str], Iterator["Submission"]]] = {
+        "hot": lambda sub, limit, time_filter: sub.hot(limit=limit),
+        "new": lambda sub, limit, time_filter: sub.new(limit=limit),
+        "top": lambda sub, limit, time_filter: sub.top(time_filter=time_filter, limit=limit),
+        "rising": lambda sub, limit, time_filter: sub.rising(limit=limit),
+        "controversial": lambda sub, limit, time_filter: sub.controversial(
+            time_filter=time_filter, limit=limit
+        ),
+    }
+    
+    # Seconds to reuse the result of check_authenticated()
+    _AUTH_CACHE_TTL = 60.0
+    
+    # Length of Reddit's rate limit window in seconds
+    _RATE_LIMIT_WINDOW = 600.0
+    
+    # Longest wait between requests when Reddit does not report its reset time
+    _MAX_UNTIMED_INTERVAL = 1.0
+    
+    # Maximum number of subreddit handles kept for listings and searches
+    _SUBREDDIT_CACHE_SIZE = 128
+    
     def __init__(
         self,
         client_id: str,
@@ -51,7 +102,7 @@ class RedditClient:
         self._password = password
         
         # Initialize PRAW
-        self._reddit = praw.Reddit(
+        self._reddit: "Reddit" = _load_praw().Reddit(
             client_id=client_id,
             client_secret=client_secret,
             user_agent=user_agent,
@@ -59,33 +110,44 @@ class RedditClient:
             password=password,
         )
         
-        # Rate limiting state
-        self._last_request_time: float = 0
-        self._min_request_interval: float = 1.0  # seconds
+        # Rate limiting state (monotonic clock)
+        self._next_request_time: float = 0.0
+        self._min_request_interval: float = 1.0  # seconds, until Reddit reports limits
+        
+        # Lazy PRAW subreddit handles for listings, keyed by name (oldest first)
+        self._subreddit_cache: dict[str, "Subreddit"] = {}
+        
+        # (result, monotonic deadline) of the last authentication check
+        self._auth_cache: tuple[bool, float] = (False, 0.0)
     
-    @property
-    def authenticated(self) -> bool:
-        """Check if the client has valid authentication."""
+    def check_authenticated(self) -> bool:
+        """Check if the client has valid authentication.
+        
+        Makes a request to Reddit, so the result is cached for
+        ``_AUTH_CACHE_TTL`` seconds. Failed checks are not cached.
+        """
+        now = time.monotonic()
+        result, deadline = self._auth_cache
+        if now < deadline:
+            return result
         try:
-            return self._reddit.user.me() is not None
+            result = self._reddit.user.me() is not None
         except Exception:
             return False
-    
-    @property
-    def is_authenticated(self) -> bool:
-        """Alias for authenticated property."""
-        return self.authenticated
+        self._auth_cache = (result, now + self._AUTH_CACHE_TTL)
+        return result
     
     @property
     def requests_remaining(self) -> Optional[int]:
         """Get remaining API requests if available."""
         try:
-            return self._reddit.auth.limits.get("remaining")
+            remaining = self._reddit.auth.limits.get("remaining")
         except Exception:
             return None
+        return remaining if isinstance(remaining, int) else None
     
     @property
-    def rate_limit(self) -> dict:
+    def rate_limit(self) -> dict[str, Any]:
         """Get current rate limit information."""
         try:
             limits = self._reddit.auth.limits
@@ -97,22 +159,62 @@ class RedditClient:
         except Exception:
             return {}
     
+    def _update_request_interval(self) -> None:
+        """Spread the remaining request quota over the rate limit window.
+        
+        Older PRAW releases that report ``reset_timestamp`` use the actual
+        time left until reset. PRAW 8 reports only ``remaining``/``used``
+        for the whole OAuth app, so the quota is spread over a full
+        ``_RATE_LIMIT_WINDOW`` but the interval is capped at
+        ``_MAX_UNTIMED_INTERVAL``; prawcore already waits for the real reset
+        when the quota runs out. Keeps the previous interval until Reddit
+        has reported its limits.
+        """
+        limits = self.rate_limit
+        remaining = limits.get("remaining")
+        if not isinstance(remaining, (int, float)):
+            return
+        reset_timestamp = limits.get("reset_timestamp")
+        if isinstance(reset_timestamp, (int, float)):
+            window = max(reset_timestamp - time.time(), 0.0)
+            self._min_request_interval = window / max(remaining, 1)
+        else:
+            self._min_request_interval = min(
+                self._RATE_LIMIT_WINDOW / max(remaining, 1), self._MAX_UNTIMED_INTERVAL
+            )
+    
     def _respect_rate_limit(self) -> None:
-        """Ensure minimum time between requests."""
-        now = time.time()
-        elapsed = now - self._last_request_time
-        if elapsed < self._min_request_interval:
-            time.sleep(self._min_request_interval - elapsed)
-        self._last_request_time = time.time()
-    
-    def get_subreddit(self, name: str) -> Subreddit:
+        """Wait until the next request slot, then reserve the following one."""
+        self._update_request_interval()
+        deadline = self._next_request_time
+        now = time.monotonic()
+        if now < deadline:
+            time.sleep(deadline - now)
+            now = time.monotonic()
+        self._next_request_time = now + self._min_request_interval
+    
+    def _subreddit(self, name: str) -> "Subreddit":
+        """Return a cached PRAW subreddit handle for listing and search calls.
+        
+        Listings and searches always hit the API, so reusing the lazy handle
+        never serves stale data. At most ``_SUBREDDIT_CACHE_SIZE`` handles are
+        kept; the oldest is dropped when the cache is full.
+        """
+        sub = self._subreddit_cache.get(name)
+        if sub is None:
+            if len(self._subreddit_cache) >= self._SUBREDDIT_CACHE_SIZE:
+                del self._subreddit_cache[next(iter(self._subreddit_cache))]
+            sub = self._subreddit_cache[name] = self._reddit.subreddit(name)
+        return sub
+    
+    def get_subreddit(self, name: str) -> "Subreddit":
         """Get a subreddit by name.
         
         Args:
             name: Subreddit name (without r/ prefix)
             
         Returns:
-            PRAW Subreddit object
+            A new PRAW Subreddit object, so its attributes are fetched fresh
         """
         self._respect_rate_limit()
         return self._reddit.subreddit(name)
@@ -123,7 +225,7 @@ class RedditClient:
         sort: str = "hot",
         limit: int = 10,
         time_filter: str = "all",
-    ) -> Iterator[Submission]:
+    ) -> Iterator["Submission"]:
         """Get posts from a subreddit.
         
         Args:
@@ -136,24 +238,12 @@ class RedditClient:
             PRAW Submission objects
         """
         self._respect_rate_limit()
-        sub = self._reddit.subreddit(subreddit)
-        
-        if sort == "hot":
-            posts = sub.hot(limit=limit)
-        elif sort == "new":
-            posts = sub.new(limit=limit)
-        elif sort == "top":
-            posts = sub.top(time_filter=time_filter, limit=limit)
-        elif sort == "rising":
-            posts = sub.rising(limit=limit)
-        elif sort == "controversial":
-            posts = sub.controversial(time_filter=time_filter, limit=limit)
-        else:
-            posts = sub.hot(limit=limit)
+        sub = self._subreddit(subreddit)
+        listing = self._SORT_DISPATCH.get(sort, self._SORT_DISPATCH["hot"])
         
-        yield from posts
+        yield from listing(sub, limit, time_filter)
     
-    def get_post(self, post_id: str) -> Submission:
+    def get_post(self, post_id: str) -> "Submission":
         """Get a specific post by ID.
         
         Args:
@@ -170,7 +260,7 @@ class RedditClient:
         post_id: str,
         limit: Optional[int] = None,
         sort: str = "best",
-    ) -> Iterator[Comment]:
+    ) -> Iterator["Comment"]:
         """Get comments from a post.
         
         Args:
@@ -185,13 +275,9 @@ class RedditClient:
         submission = self._reddit.submission(id=post_id)
         submission.comment_sort = sort
         
-        if limit:
-            submission.comments.replace_more(limit=0)
-            for comment in submission.comments.list()[:limit]:
-                yield comment
-        else:
-            submission.comments.replace_more(limit=0)
-            yield from submission.comments.list()
+        submission.comments.replace_more(limit=0)
+        # islice(..., None) yields everything; no sliced copy is made
+        yield from islice(submission.comments.list(), limit or None)
     
     def search(
         self,
@@ -199,7 +285,7 @@ class RedditClient:
         subreddit: Optional[str] = None,
         sort: str = "relevance",
         limit: int = 25,
-    ) -> Iterator[Submission]:
+    ) -> Iterator["Submission"]:
         """Search for posts.
         
         Args:
@@ -213,15 +299,12 @@ class RedditClient:
         """
         self._respect_rate_limit()
         
-        if subreddit:
-            sub = self._reddit.subreddit(subreddit)
-            results = sub.search(query, sort=sort, limit=limit)
-        else:
-            results = self._reddit.subreddit("all").search(query, sort=sort, limit=limit)
+        sub = self._subreddit(subreddit or "all")
+        results = sub.search(query, sort=sort, limit=limit)
         
         yield from results
     
-    def submit_comment(self, post_id: str, body: str) -> Comment:
+    def submit_comment(self, post_id: str, body: str) -> "Comment":
         """Submit a comment to a post.
         
         Args:
@@ -233,4 +316,5 @@ class RedditClient:
         """
         self._respect_rate_limit()
         submission = self._reddit.submission(id=post_id)
-        return submission.reply(body)
+        # Replies to a submission are always comments
+        return cast("Comment", submission.reply(body))
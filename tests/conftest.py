@@ -1,21 +1,42 @@
 """Pytest configuration and shared fixtures for Redditor tests."""
 
+import os
+
 import pytest
 from pathlib import Path
 from unittest.mock import MagicMock
 
+# Keep importing redditor.config from reading the developer's environment.
+os.environ.setdefault("REDDITOR_SKIP_EAGER_SETTINGS", "1")
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def project_root() -> Path:
     """Return the project root directory."""
-    return Path(__file__).parent.parent
+    return Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(scope="session")
+def project_tree(project_root: Path) -> frozenset[str]:
+    """Relative paths of the directories directly under src/redditor and tests.
+    
+    Built with a single os.scandir pass per parent directory.
+    """
+    paths = set()
+    for parent in ("src/redditor", "tests"):
+        try:
+            with os.scandir(project_root / parent) as entries:
+                paths.update(f"{parent}/{entry.name}" for entry in entries if entry.is_dir())
+        except FileNotFoundError:
+            continue
+    return frozenset(paths)
 
 
 @pytest.fixture
 def mock_reddit_client():
     """Mock Reddit client for testing without actual API calls."""
     client = MagicMock()
-    client.authenticated = True
+    client.check_authenticated.return_value = True
     client.username = "test_user"
     return client
 
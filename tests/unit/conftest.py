@@ -0,0 +1,85 @@
+"""Shared fixtures for Redditor unit tests."""
+
+import importlib
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+# Reddit API credentials shared (read-only) by every client test
+TEST_CREDENTIALS = MappingProxyType({
+    "client_id": "test_client_id",
+    "client_secret": "test_secret",
+    "user_agent": "test_agent",
+})
+
+
+@pytest.fixture(scope="session")
+def credentials():
+    """Read-only test credentials for constructing a RedditClient."""
+    return TEST_CREDENTIALS
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _stub_praw():
+    """Replace PRAW with a stub so no test builds a real praw.Reddit."""
+    import redditor.reddit.client as client_module
+    
+    original = client_module.praw
+    client_module.praw = SimpleNamespace(Reddit=lambda **kwargs: Mock())
+    yield
+    client_module.praw = original
+
+
+@pytest.fixture(scope="class")
+def _shared_reddit_client():
+    """One mocked RedditClient per test class."""
+    from redditor.reddit.client import RedditClient
+    
+    client = RedditClient(**TEST_CREDENTIALS)
+    # Plain Mock restricted to the PRAW entry points the client uses
+    client._reddit = Mock(spec_set=["subreddit", "submission"])
+    return client
+
+
+@pytest.fixture
+def mock_client(_shared_reddit_client):
+    """Mocked Reddit client, reset to a clean state for each test."""
+    client = _shared_reddit_client
+    client._reddit.reset_mock(return_value=True, side_effect=True)
+    client._subreddit_cache.clear()
+    client._auth_cache = (False, 0.0)
+    client._next_request_time = 0.0
+    # No pacing between calls; rate limiting has its own tests
+    client._min_request_interval = 0.0
+    return client
+
+
+@pytest.fixture
+def isolated_registry():
+    """PipelineRegistry whose registrations are rolled back after the test."""
+    from redditor.pipelines.registry import PipelineRegistry
+    
+    snapshot = dict(PipelineRegistry._pipelines)
+    yield PipelineRegistry
+    # Restore in place: PipelineRegistry.all() is a live view of this dict
+    PipelineRegistry._pipelines.clear()
+    PipelineRegistry._pipelines.update(snapshot)
+
+
+@pytest.fixture(scope="session")
+def all_redditor_modules():
+    """Core redditor modules, each imported exactly once per session."""
+    names = (
+        "redditor.config",
+        "redditor.cli",
+        "redditor.reddit.client",
+        "redditor.pipelines.base",
+        "redditor.pipelines.registry",
+    )
+    return {name: importlib.import_module(name) for name in names}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _preload_redditor(all_redditor_modules):
+    """Warm sys.modules so in-test redditor imports are plain lookups."""
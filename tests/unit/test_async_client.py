@@ -0,0 +1,211 @@
+"""Black-box tests for the async Reddit API client.
+
+These tests run the client against an in-process httpx transport,
+so no real network calls are made.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+
+def make_transport(posts_by_subreddit, calls):
+    """Build a mock transport serving tokens and subreddit listings."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if request.url.path == "/api/v1/access_token":
+            return httpx.Response(200, json={"access_token": "token", "expires_in": 3600})
+
+        subreddit = request.url.path.split("/")[2]
+        if subreddit not in posts_by_subreddit:
+            return httpx.Response(404, json={"error": 404})
+        limit = int(request.url.params["limit"])
+        children = [{"kind": "t3", "data": post} for post in posts_by_subreddit[subreddit][:limit]]
+        return httpx.Response(
+            200,
+            json={"data": {"children": children, "after": None}},
+            headers={"x-ratelimit-remaining": "99", "x-ratelimit-used": "1"},
+        )
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.fixture
+def posts_by_subreddit():
+    """Listing data keyed by subreddit name."""
+    return {
+        "python": [{"id": f"py{i}", "title": f"Python {i}"} for i in range(5)],
+        "rust": [{"id": f"rs{i}", "title": f"Rust {i}"} for i in range(3)],
+    }
+
+
+class TestAsyncRedditClient:
+    """Tests for the httpx-based async client."""
+
+    def test_client_requires_credentials(self):
+        """Client should require Reddit API credentials."""
+        from redditor.reddit.async_client import AsyncRedditClient
+
+        with pytest.raises(ValueError):
+            AsyncRedditClient(client_id="", client_secret="", user_agent="test")
+
+    @pytest.mark.asyncio
+    async def test_get_posts_yields_post_dicts(self, posts_by_subreddit):
+        """get_posts should yield plain post dictionaries up to the limit."""
+        from redditor.reddit.async_client import AsyncRedditClient
+
+        calls = []
+        async with AsyncRedditClient(
+            client_id="test",
+            client_secret="test",
+            user_agent="test",
+            transport=make_transport(posts_by_subreddit, calls),
+        ) as client:
+            posts = [post async for post in client.get_posts("python", limit=2)]
+
+        assert posts == posts_by_subreddit["python"][:2]
+        assert calls[-1].headers["Authorization"] == "Bearer token"
+
+    @pytest.mark.asyncio
+    async def test_fetch_posts_fans_out_with_one_token_request(self, posts_by_subreddit):
+        """fetch_posts should query every subreddit and reuse a single token."""
+        from redditor.reddit.async_client import AsyncRedditClient
+
+        calls = []
+        async with AsyncRedditClient(
+            client_id="test",
+            client_secret="test",
+            user_agent="test",
+            transport=make_transport(posts_by_subreddit, calls),
+        ) as client:
+            results = await client.fetch_posts(["python", "rust"], limit=10)
+            rate_limit = client.rate_limit
+
+        assert {name: len(posts) for name, posts in results.items()} == {"python": 5, "rust": 3}
+        token_requests = [c for c in calls if c.url.path == "/api/v1/access_token"]
+        assert len(token_requests) == 1
+        assert rate_limit["remaining"] == 99
+
+    @pytest.mark.asyncio
+    async def test_fetch_posts_skips_failing_subreddits(self, posts_by_subreddit):
+        """A subreddit Reddit refuses should not discard the other results."""
+        from redditor.reddit.async_client import AsyncRedditClient
+
+        calls = []
+        async with AsyncRedditClient(
+            client_id="test",
+            client_secret="test",
+            user_agent="test",
+            transport=make_transport(posts_by_subreddit, calls),
+        ) as client:
+            results = await client.fetch_posts(["python", "missing", "rust"], limit=10)
+
+        assert results == {
+            "python": posts_by_subreddit["python"],
+            "rust": posts_by_subreddit["rust"],
+        }
+
+    @pytest.mark.asyncio
+    async def test_fetch_posts_raises_on_bad_credentials(self):
+        """A rejected token request should fail the batch, not look like no posts."""
+        from redditor.reddit.async_client import AsyncRedditClient
+
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(401, json={"error": 401})
+
+        async with AsyncRedditClient(
+            client_id="test",
+            client_secret="wrong",
+            user_agent="test",
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.fetch_posts(["python", "rust"])
+
+        assert [c.url.path for c in calls] == ["/api/v1/access_token"]
+
+    @pytest.mark.asyncio
+    async def test_password_grant_used_with_user_credentials(self, posts_by_subreddit):
+        """Username and password should switch the token request to the password grant."""
+        from redditor.reddit.async_client import AsyncRedditClient
+
+        calls = []
+        async with AsyncRedditClient(
+            client_id="test",
+            client_secret="test",
+            user_agent="test",
+            username="user",
+            password="pass",
+            transport=make_transport(posts_by_subreddit, calls),
+        ) as client:
+            await client.fetch_posts(["rust"])
+
+        body = calls[0].content.decode()
+        assert "grant_type=password" in body
+        assert "username=user" in body
+
+    @pytest.mark.asyncio
+    async def test_waits_for_reset_when_quota_exhausted(self, monkeypatch):
+        """A request after remaining hits zero should wait for the reset."""
+        from redditor.reddit.async_client import AsyncRedditClient
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/api/v1/access_token":
+                return httpx.Response(200, json={"access_token": "token", "expires_in": 3600})
+            after = None if "after" in request.url.params else "t3_next"
+            children = [{"kind": "t3", "data": {"id": request.url.params.get("after", "first")}}]
+            return httpx.Response(
+                200,
+                json={"data": {"children": children, "after": after}},
+                headers={"x-ratelimit-remaining": "0", "x-ratelimit-reset": "30"},
+            )
+
+        delays = []
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+        async with AsyncRedditClient(
+            client_id="test",
+            client_secret="test",
+            user_agent="test",
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            posts = [post async for post in client.get_posts("python", limit=2)]
+
+        assert [post["id"] for post in posts] == ["first", "t3_next"]
+        assert len(delays) == 1
+        assert 29 < delays[0] <= 30
+
+    @pytest.mark.asyncio
+    async def test_reset_wait_ignores_wall_clock_jumps(self, monkeypatch):
+        """The reset wait should follow the monotonic clock, not wall-clock time."""
+        import time
+
+        from redditor.reddit.async_client import AsyncRedditClient
+
+        delays = []
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+        async with AsyncRedditClient(
+            client_id="test", client_secret="test", user_agent="test"
+        ) as client:
+            client._record_rate_limit(
+                httpx.Headers({"x-ratelimit-remaining": "0", "x-ratelimit-reset": "30"})
+            )
+            # Simulate an NTP step of one hour forward
+            wall_clock = time.time() + 3600
+            monkeypatch.setattr(time, "time", lambda: wall_clock)
+            await client._wait_for_rate_limit()
+
+        assert len(delays) == 1
+        assert 29 < delays[0] <= 30
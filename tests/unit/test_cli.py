@@ -60,6 +60,32 @@ class TestCLIPipelineCommands:
         result = runner.invoke(main, ["pipeline", "run", "--help"])
         # Should show help for run command
         assert result.exit_code in (0, 2), f"Unexpected error: {result.output}"
+    
+    def test_pipeline_run_calls_lifecycle_once(self, runner, isolated_registry):
+        """Running a pipeline should set it up and clean it up exactly once."""
+        from redditor.cli import main
+        from redditor.pipelines.base import Pipeline
+        
+        calls = []
+        
+        class LifecyclePipeline(Pipeline):
+            name = "lifecycle_pipeline"
+            
+            def setup(self):
+                calls.append("setup")
+            
+            def execute(self):
+                calls.append("execute")
+                return {"status": "success"}
+            
+            def cleanup(self):
+                calls.append("cleanup")
+        
+        isolated_registry.register(LifecyclePipeline)
+        result = runner.invoke(main, ["pipeline", "run", "lifecycle_pipeline"])
+        
+        assert result.exit_code == 0, f"Unexpected error: {result.output}"
+        assert calls == ["setup", "execute", "cleanup"]
 
 
 class TestCLIConfigCommands:
@@ -76,3 +102,11 @@ class TestCLIConfigCommands:
         result = runner.invoke(main, ["config", "--help"])
         # Config commands should be accessible
         assert result.exit_code in (0, 2), f"Unexpected error: {result.output}"
+    
+    def test_config_show_displays_sections(self, runner):
+        """'config show' should print each configuration section."""
+        from redditor.cli import main
+        result = runner.invoke(main, ["config", "show"])
+        assert result.exit_code == 0, f"Unexpected error: {result.output}"
+        for heading in ("Redditor Configuration", "Reddit API:", "AI Configuration:", "Database:"):
+            assert heading in result.output
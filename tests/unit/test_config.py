@@ -0,0 +1,49 @@
+"""Black-box tests for Redditor configuration.
+
+These tests verify settings are read from the environment using
+the documented variable names.
+"""
+
+
+class TestSettingsEnvironment:
+    """Tests for loading settings from environment variables."""
+
+    def test_defaults_without_environment(self, monkeypatch, tmp_path):
+        """Settings should fall back to defaults when nothing is set."""
+        from redditor.config import Settings
+
+        monkeypatch.chdir(tmp_path)
+        settings = Settings()
+
+        assert settings.debug is False
+        assert settings.reddit.client_id == ""
+        assert settings.database.url == "sqlite:///./redditor.db"
+
+    def test_nested_environment_variables(self, monkeypatch, tmp_path):
+        """Sub-settings should be populated from nested variables."""
+        from redditor.config import Settings
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("REDDITOR_REDDIT__CLIENT_ID", "abc")
+        monkeypatch.setenv("REDDITOR_REDDIT__CLIENT_SECRET", "xyz")
+        monkeypatch.setenv("REDDITOR_AI__OPENAI_API_KEY", "sk-test")
+        monkeypatch.setenv("REDDITOR_DATABASE__ECHO", "true")
+        settings = Settings()
+
+        assert settings.reddit.client_id == "abc"
+        assert settings.is_reddit_configured()
+        assert settings.is_ai_configured()
+        assert settings.database.echo is True
+
+
+class TestGetSettings:
+    """Tests for the shared settings accessor."""
+
+    def test_get_settings_returns_shared_instance(self):
+        """Repeated calls should return the same Settings object."""
+        from redditor.config import Settings, get_settings
+
+        settings = get_settings()
+
+        assert isinstance(settings, Settings)
+        assert get_settings() is settings
@@ -4,9 +4,19 @@ These tests verify that the package is properly structured and all
 expected modules can be imported successfully.
 """
 
+import importlib.util
+import re
+import subprocess
+import sys
+
 import pytest
 from pathlib import Path
 
+import redditor
+
+# Matches patterns like 0.1.0, 1.0.0, 2.1.3-alpha, etc.
+_SEMVER_RE = re.compile(r"^\d+\.\d+\.\d+(-[a-zA-Z0-9]+)?$")
+
 
 class TestPackageStructure:
     """Tests for verifying the project structure matches tech-stack.yml."""
@@ -22,9 +32,9 @@ class TestPackageStructure:
         init_file = project_root / "src" / "redditor" / "__init__.py"
         assert init_file.exists(), f"__init__.py not found: {init_file}"
     
-    def test_required_subdirectories_exist(self, project_root: Path):
-        """All required subdirectories from tech-stack.yml must exist."""
-        required_dirs = [
+    @pytest.mark.parametrize(
+        "dir_path",
+        [
             "src/redditor/api",
             "src/redditor/agents",
             "src/redditor/pipelines",
@@ -33,10 +43,11 @@ class TestPackageStructure:
             "src/redditor/utils",
             "tests/unit",
             "tests/integration",
-        ]
-        for dir_path in required_dirs:
-            full_path = project_root / dir_path
-            assert full_path.exists(), f"Required directory not found: {dir_path}"
+        ],
+    )
+    def test_required_subdirectory_exists(self, project_tree: frozenset[str], dir_path: str):
+        """Each required subdirectory from tech-stack.yml must exist."""
+        assert dir_path in project_tree, f"Required directory not found: {dir_path}"
     
     def test_project_has_requirements_file(self, project_root: Path):
         """Project must have requirements.txt for dependencies."""
@@ -47,37 +58,59 @@ class TestPackageStructure:
         """Project must have README.md with documentation."""
         readme = project_root / "README.md"
         assert readme.exists(), "README.md not found in project root"
-        content = readme.read_text()
-        assert len(content) > 100, "README.md is too short"
+        assert readme.stat().st_size > 100, "README.md is too short"
 
 
 class TestPackageImports:
     """Tests for verifying package imports work correctly."""
     
+    @pytest.mark.parametrize(
+        "module_name",
+        ["redditor.config", "redditor.cli", "redditor.reddit.client", "redditor.pipelines.base"],
+    )
+    def test_module_is_importable(self, module_name: str):
+        """Each core module must be locatable without executing it."""
+        assert importlib.util.find_spec(module_name) is not None, f"{module_name} not found"
+    
     def test_import_redditor_package(self):
         """The redditor package must be importable."""
-        import redditor
         assert hasattr(redditor, "__version__"), "Package must define __version__"
     
-    def test_import_config_module(self):
+    def test_import_config_module(self, all_redditor_modules):
         """The config module must be importable."""
-        from redditor import config
+        config = all_redditor_modules["redditor.config"]
         assert hasattr(config, "Settings"), "Config must define Settings class"
     
-    def test_import_cli_module(self):
+    def test_import_cli_module(self, all_redditor_modules):
         """The CLI module must be importable."""
-        from redditor import cli
+        cli = all_redditor_modules["redditor.cli"]
         assert hasattr(cli, "main"), "CLI must define main function/group"
     
-    def test_import_reddit_client(self):
+    def test_import_reddit_client(self, all_redditor_modules):
         """The Reddit client must be importable."""
-        from redditor.reddit import client
+        client = all_redditor_modules["redditor.reddit.client"]
         assert hasattr(client, "RedditClient"), "Reddit module must define RedditClient"
     
-    def test_import_pipeline_base(self):
+    def test_import_pipeline_base(self, all_redditor_modules):
         """The Pipeline base class must be importable."""
-        from redditor.pipelines import base
+        base = all_redditor_modules["redditor.pipelines.base"]
         assert hasattr(base, "Pipeline"), "Pipelines module must define Pipeline class"
+    
+    def test_import_redditor_does_not_load_praw(self):
+        """Importing the package must not import PRAW until a client is built."""
+        code = "import sys, redditor; sys.exit('praw' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code])
+        assert result.returncode == 0, "import redditor pulled in praw"
+    
+    def test_package_exports_resolve_lazily(self):
+        """Public names must resolve on access without eager submodule imports."""
+        code = (
+            "import sys, redditor; "
+            "assert 'redditor.config' not in sys.modules; "
+            "from redditor import Settings, Pipeline, PipelineRegistry, RedditClient"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
 
 
 class TestVersioning:
@@ -85,10 +118,5 @@ class TestVersioning:
     
     def test_version_format(self):
         """Version must follow semantic versioning format."""
-        import redditor
-        import re
-        
         version = redditor.__version__
-        # Matches patterns like 0.1.0, 1.0.0, 2.1.3-alpha, etc.
-        pattern = r"^\d+\.\d+\.\d+(-[a-zA-Z0-9]+)?$"
-        assert re.match(pattern, version), f"Invalid version format: {version}"
+        assert _SEMVER_RE.match(version), f"Invalid version format: {version}"
@@ -4,8 +4,78 @@ These tests verify the pipeline framework's public interface
 and expected behavior for defining and executing pipelines.
 """
 
+import sys
+from abc import abstractmethod
+from types import MappingProxyType
+
 import pytest
-from unittest.mock import MagicMock, patch
+
+from redditor.pipelines.base import Pipeline
+
+
+# Concrete pipelines shared across tests (built once at import time)
+
+class _NamedPipeline(Pipeline):
+    name = "named_pipeline"
+    
+    def execute(self):
+        pass
+
+
+class _StrictPipeline(Pipeline):
+    name = "strict_pipeline"
+    required_config = ["api_key", "subreddit"]
+    
+    def execute(self):
+        pass
+
+
+class _SlottedPipeline(Pipeline):
+    __slots__ = ()
+    name = "slotted_pipeline"
+    
+    def execute(self):
+        pass
+
+
+class _ResultPipeline(Pipeline):
+    name = "result_pipeline"
+    
+    def execute(self):
+        return {"status": "success", "items_processed": 10}
+
+
+class _FailingPipeline(Pipeline):
+    name = "failing_pipeline"
+    
+    def execute(self):
+        raise RuntimeError("Simulated failure")
+
+
+@pytest.fixture
+def discovered_package(tmp_path, monkeypatch):
+    """Temporary pipeline package on sys.path, unloaded after the test."""
+    name = "discovered_pipelines"
+    package = tmp_path / name
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "_private.py").write_text("raise RuntimeError('must not import')\n")
+    (package / "notes.txt").write_text("not a module\n")
+    (package / "greeter.py").write_text(
+        "from redditor.pipelines.base import Pipeline\n"
+        "from redditor.pipelines.registry import register_pipeline\n"
+        "\n"
+        "@register_pipeline\n"
+        "class GreeterPipeline(Pipeline):\n"
+        "    name = 'greeter_pipeline'\n"
+        "\n"
+        "    def execute(self):\n"
+        "        return {'status': 'success'}\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield name
+    for module in [m for m in sys.modules if m == name or m.startswith(f"{name}.")]:
+        del sys.modules[module]
 
 
 class TestPipelineBaseClass:
@@ -13,44 +83,58 @@ class TestPipelineBaseClass:
     
     def test_pipeline_is_abstract(self):
         """Pipeline class should be abstract and not directly instantiable."""
-        from redditor.pipelines.base import Pipeline
-        
         # Should not be able to instantiate abstract pipeline
         with pytest.raises(TypeError):
             Pipeline()
     
     def test_pipeline_has_execute_method(self):
         """Pipeline must define execute as an abstract method."""
-        from redditor.pipelines.base import Pipeline
-        import abc
-        
         # execute should be an abstract method
         assert hasattr(Pipeline, "execute")
         assert getattr(Pipeline.execute, "__isabstractmethod__", False)
     
     def test_pipeline_has_name_property(self):
         """Pipeline should have a name property."""
-        from redditor.pipelines.base import Pipeline
-        
-        # Create a concrete implementation
-        class TestPipeline(Pipeline):
-            @property
-            def name(self):
-                return "test_pipeline"
-            
-            def execute(self):
-                pass
-        
-        pipeline = TestPipeline()
-        assert pipeline.name == "test_pipeline"
+        pipeline = _NamedPipeline()
+        assert pipeline.name == "named_pipeline"
     
     def test_pipeline_has_lifecycle_methods(self):
         """Pipeline should have setup and cleanup lifecycle methods."""
-        from redditor.pipelines.base import Pipeline
-        
         # These should be defined (possibly as no-ops by default)
-        assert hasattr(Pipeline, "setup") or hasattr(Pipeline, "_setup")
-        assert hasattr(Pipeline, "cleanup") or hasattr(Pipeline, "_cleanup")
+        attrs = set(dir(Pipeline))
+        assert attrs & {"setup", "_setup"}
+        assert attrs & {"cleanup", "_cleanup"}
+    
+    def test_slotted_subclass_has_no_instance_dict(self):
+        """Subclasses declaring __slots__ should not carry a per-instance __dict__."""
+        assert not hasattr(_SlottedPipeline(), "__dict__")
+    
+    def test_template_base_with_own_abstract_method_may_omit_name(self):
+        """A base implementing execute() but adding its own abstract hook needs no name."""
+        class FetchingPipeline(Pipeline):
+            @abstractmethod
+            def fetch(self):
+                ...
+            
+            def execute(self):
+                return {"status": "success", "items": self.fetch()}
+        
+        class ConcreteFetchingPipeline(FetchingPipeline):
+            name = "concrete_fetching_pipeline"
+            
+            def fetch(self):
+                return []
+        
+        assert ConcreteFetchingPipeline().execute() == {"status": "success", "items": []}
+        with pytest.raises(TypeError):
+            FetchingPipeline()
+    
+    def test_pipeline_requires_name(self):
+        """Concrete pipelines must declare a name."""
+        with pytest.raises(TypeError):
+            class UnnamedPipeline(Pipeline):
+                def execute(self):
+                    pass
 
 
 class TestPipelineConfiguration:
@@ -58,85 +142,68 @@ class TestPipelineConfiguration:
     
     def test_pipeline_accepts_config_dict(self):
         """Pipeline should accept configuration as dictionary."""
-        from redditor.pipelines.base import Pipeline
-        
-        class TestPipeline(Pipeline):
-            @property
-            def name(self):
-                return "test_pipeline"
-            
-            def execute(self):
-                pass
-        
         config = {"param1": "value1", "param2": 123}
-        pipeline = TestPipeline(config=config)
+        pipeline = _NamedPipeline(config=config)
         
         # Pipeline should store configuration
-        assert hasattr(pipeline, "config") or hasattr(pipeline, "_config")
+        assert set(dir(pipeline)) & {"config", "_config"}
     
     def test_pipeline_config_validation(self):
         """Pipeline should validate required configuration."""
-        from redditor.pipelines.base import Pipeline
-        
-        class StrictPipeline(Pipeline):
-            required_config = ["api_key", "subreddit"]
-            
-            @property
-            def name(self):
-                return "strict_pipeline"
-            
-            def execute(self):
-                pass
-        
         # Missing required config should raise error
         # This is optional behavior - implementation may vary
         # Just verify we can create with valid config
         config = {"api_key": "xxx", "subreddit": "test"}
-        pipeline = StrictPipeline(config=config)
+        pipeline = _StrictPipeline(config=config)
         assert pipeline is not None
+        
+        with pytest.raises(ValueError, match="subreddit"):
+            _StrictPipeline(config={"api_key": "xxx"})
 
 
+@pytest.mark.usefixtures("isolated_registry")
 class TestPipelineRegistry:
     """Tests for pipeline registry functionality."""
     
     def test_registry_can_register_pipeline(self):
         """Should be able to register pipelines."""
         from redditor.pipelines.registry import PipelineRegistry
-        from redditor.pipelines.base import Pipeline
-        
-        class MyPipeline(Pipeline):
-            @property
-            def name(self):
-                return "my_pipeline"
-            
-            def execute(self):
-                pass
         
         registry = PipelineRegistry()
-        registry.register(MyPipeline)
+        registry.register(_NamedPipeline)
         
         # Pipeline should be findable
-        assert "my_pipeline" in registry or MyPipeline in registry.all()
+        assert "named_pipeline" in registry or _NamedPipeline in registry.all()
     
     def test_registry_can_get_pipeline_by_name(self):
         """Should retrieve pipeline by name."""
         from redditor.pipelines.registry import PipelineRegistry
-        from redditor.pipelines.base import Pipeline
-        
-        class NamedPipeline(Pipeline):
-            @property
-            def name(self):
-                return "named_pipeline"
-            
-            def execute(self):
-                pass
         
         registry = PipelineRegistry()
-        registry.register(NamedPipeline)
+        registry.register(_NamedPipeline)
         
         retrieved = registry.get("named_pipeline")
         assert retrieved is not None
     
+    def test_registry_is_usable_without_instance(self):
+        """Registry methods should work directly on the class."""
+        from redditor.pipelines.registry import PipelineRegistry
+        
+        PipelineRegistry.register(_ResultPipeline)
+        
+        assert PipelineRegistry.get("result_pipeline") is _ResultPipeline
+        assert PipelineRegistry.has("result_pipeline")
+        assert not PipelineRegistry.has("missing_pipeline")
+    
+    def test_registry_discovers_public_modules(self, discovered_package):
+        """discover() should import public modules and skip private ones."""
+        from redditor.pipelines.registry import PipelineRegistry
+        
+        imported = PipelineRegistry.discover(discovered_package)
+        
+        assert imported == [f"{discovered_package}.greeter"]
+        assert PipelineRegistry.has("greeter_pipeline")
+    
     def test_registry_lists_all_pipelines(self):
         """Should list all registered pipelines."""
         from redditor.pipelines.registry import PipelineRegistry
@@ -144,8 +211,26 @@ class TestPipelineRegistry:
         registry = PipelineRegistry()
         all_pipelines = registry.all()
         
-        # Should return a list or dict
-        assert isinstance(all_pipelines, (list, dict))
+        # Should return exactly a list, dict or read-only mapping view
+        assert type(all_pipelines) in (list, dict, MappingProxyType)
+    
+    def test_registry_all_is_read_only(self):
+        """The mapping returned by all() should not allow mutation."""
+        from redditor.pipelines.registry import PipelineRegistry
+        
+        with pytest.raises(TypeError):
+            PipelineRegistry.all()["rogue"] = object
+    
+    def test_registry_rejects_unnamed_pipeline(self):
+        """Abstract intermediate bases without a name should not register."""
+        from redditor.pipelines.registry import PipelineRegistry
+        
+        class IntermediatePipeline(Pipeline):
+            pass
+        
+        with pytest.raises(TypeError):
+            PipelineRegistry.register(IntermediatePipeline)
+        assert not PipelineRegistry.has("")
 
 
 class TestPipelineExecution:
@@ -153,17 +238,7 @@ class TestPipelineExecution:
     
     def test_execute_returns_result(self):
         """Execute should return a result object."""
-        from redditor.pipelines.base import Pipeline
-        
-        class ResultPipeline(Pipeline):
-            @property
-            def name(self):
-                return "result_pipeline"
-            
-            def execute(self):
-                return {"status": "success", "items_processed": 10}
-        
-        pipeline = ResultPipeline()
+        pipeline = _ResultPipeline()
         result = pipeline.execute()
         
         assert result is not None
@@ -171,17 +246,7 @@ class TestPipelineExecution:
     
     def test_execute_handles_errors_gracefully(self):
         """Pipeline should handle execution errors gracefully."""
-        from redditor.pipelines.base import Pipeline
-        
-        class FailingPipeline(Pipeline):
-            @property
-            def name(self):
-                return "failing_pipeline"
-            
-            def execute(self):
-                raise RuntimeError("Simulated failure")
-        
-        pipeline = FailingPipeline()
+        pipeline = _FailingPipeline()
         
         # Either catches and returns error result, or raises
         # We test that it at least raises predictably